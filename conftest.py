@@ -2,6 +2,7 @@
 
 import datetime
 import os
+import subprocess
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
@@ -51,11 +52,45 @@ def add_changed_files(
         contents = [contents for _ in filenames]
     for filename, content in zip(filenames, contents):
         (git_repo.workspace / filename).write_text(content)
-        git_repo.run(f"git add {filename}")
+    # Stage everything with a single git call, bypassing the shell.
+    subprocess.run(["git", "add", *filenames], cwd=git_repo.workspace, check=True)
     if mocker:
         return mocker.patch("sys.argv", ["stub_name"] + filenames)
 
 
+def _format_git_config_value(value: str) -> str:
+    """
+    Format a value the way `git config` writes it to a config file.
+
+    Backslashes, double quotes, newlines and tabs are escaped. The value is only
+    quoted where it has leading or trailing spaces or contains a comment character,
+    so plain values are written unquoted and read back as-is by any config reader.
+    """
+    escaped = (
+        value.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("\t", "\\t")
+    )
+    if value != value.strip(" ") or "#" in value or ";" in value:
+        return f'"{escaped}"'
+    return escaped
+
+
+def set_git_identity(git_repo: GitRepo, name: str, email: Optional[str] = None):
+    """
+    Configure the git user for the repo without spawning `git config` subprocesses.
+
+    Appends a [user] section directly to the repo's config file. Git and GitPython
+    both take the last value for a key, so this overrides any earlier identity.
+    """
+    section = f"[user]\n\tname = {_format_git_config_value(name)}\n"
+    if email is not None:
+        section += f"\temail = {_format_git_config_value(email)}\n"
+    with open(git_repo.workspace / ".git" / "config", "a") as f:
+        f.write(section)
+
+
 def write_config_file(path: Path, name: str, content: str) -> Path:
     config_file = path / name
     (config_file).write_text(content)
@@ -83,7 +118,7 @@ def cwd():
 
 @pytest.fixture(scope="function")
 def git_repo(git_repo: GitRepo) -> GitRepo:
-    git_repo.run("git config user.name '<git config username sentinel>'")
+    set_git_identity(git_repo, "<git config username sentinel>")
     return git_repo
 
 
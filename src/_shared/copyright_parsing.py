@@ -3,9 +3,36 @@
 """Tools for parsing copyright strings."""
 
 import ast
+import functools
 import re
 from typing import Optional, Tuple
 
+# Lowercase tokens marking a string as relating to copyright. Matching is case
+# insensitive.
+COPYRIGHT_SIGNIFIERS: Tuple[str, ...] = ("copyright", "(c)", "©")
+
+# Regex string components shared by the copyright string parsers.
+COPYRIGHT_SIGNIFIER_GROUP: str = (
+    r"(?P<signifiers>("
+    + r"|".join(re.escape(signifier) + r"\s?" for signifier in COPYRIGHT_SIGNIFIERS)
+    + r")+)\s?"
+)
+YEAR_GROUP: str = r"(?P<year>(\d{4}\s?-\s?\d{4}|\d{4})+)\s?"
+NAME_GROUP: str = r"(?P<name>\D[^\n]+)\s?"
+
+# Regexes are compiled once at import, rather than looked up on every call.
+DOCSTRING_REGEX: re.Pattern = re.compile(
+    # Capture the copyright signifier ((c), copyright, things of this nature)
+    COPYRIGHT_SIGNIFIER_GROUP + r"\s?"
+    # Capture name and year in either order
+    + r"(?:" + YEAR_GROUP + r"|" + NAME_GROUP + r"){2}",
+    re.IGNORECASE | re.MULTILINE,
+)
+YEAR_RANGE_REGEX: re.Pattern = re.compile(
+    r"^(?P<start_year>(\d{4}))\s*-\s*(?P<end_year>(\d{4}))"
+)
+SINGLE_YEAR_REGEX: re.Pattern = re.compile(r"^(?P<year>(\d{4}))$")
+
 
 class ParsedCopyrightString:
     """Class for storing the components of a parsed copyright string."""
@@ -70,26 +97,8 @@ def _parse_copyright_docstring(input: str) -> Optional[ParsedCopyrightString]:
             returns an object containing its information. If a match was not found,
             returns None.
     """
-    # Regex string components
-    copyright_signifier_group: str = r"(?P<signifiers>(copyright\s?|\(c\)\s?|©\s?)+)\s?"
-    year_group: str = r"(?P<year>(\d{4}\s?-\s?\d{4}|\d{4})+)\s?"
-    name_group: str = r"(?P<name>\D[^\n]+)\s?"
-
-    # Construct regex string
-    exp: str = (
-        # Capture the copyright signifier ((c), copyright, things of this nature)
-        copyright_signifier_group
-        + r"\s?"
-        # Capture name and year in either order
-        + r"(?:"
-        + year_group
-        + r"|"
-        + name_group
-        + r"){2}"
-    )
-
     # Search the input
-    match = re.search(re.compile(exp, re.IGNORECASE | re.MULTILINE), input)
+    match = DOCSTRING_REGEX.search(input)
 
     # Early return for no match.
     if match is None:
@@ -138,13 +147,49 @@ def _parse_copyright_string_line(
     # Safety catch for if we've been given multiple lines.
     assert len(input.splitlines()) == 1
 
+    # Search the input
+    match = _get_copyright_line_regex(comment_markers).search(input)
+    if match is None:
+        return None
+
+    match_dict = match.groupdict()
+    start_year, end_year = _parse_years(match_dict["year"])
+    leading_comment = match_dict["leading_comment_marker"].strip()
+    trailing_comment = (
+        None
+        if not comment_markers[1]
+        else match_dict["trailing_comment_marker"].strip()
+    )
+
+    return ParsedCopyrightString(
+        (leading_comment, trailing_comment),
+        match_dict["signifiers"].strip(),
+        start_year,
+        end_year,
+        match_dict["name"].strip(),
+        match.group().strip(),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_copyright_line_regex(comment_markers: Tuple[str, Optional[str]]) -> re.Pattern:
+    """
+    Build the regex matching a single-line copyright comment.
+
+    The regex depends only on the comment markers, so is compiled once per set of
+    markers and reused for every subsequent line and file.
+
+    Args:
+        comment_markers (tuple(str, str|None)): The characters marking the beginning and
+            (optionally) end of a comment.
+
+    Returns:
+        re.Pattern: the compiled regex.
+    """
     # Regex string components
     leading_comment_marker_group: str = (
         r"(?P<leading_comment_marker>" + re.escape(comment_markers[0]) + r")"
     )
-    copyright_signifier_group: str = r"(?P<signifiers>(copyright\s?|\(c\)\s?|©\s?)+)\s?"
-    year_group: str = r"(?P<year>(\d{4}\s?-\s?\d{4}|\d{4})+)\s?"
-    name_group: str = r"(?P<name>\D[^\n]+)\s?"
 
     # Construct regex string
     exp: str = (
@@ -154,13 +199,13 @@ def _parse_copyright_string_line(
         + leading_comment_marker_group
         + r"\s?"
         # Capture the copyright signifier ((c), copyright, things of this nature)
-        + copyright_signifier_group
+        + COPYRIGHT_SIGNIFIER_GROUP
         + r"\s?"
         # Capture name and year in either order
         + r"(?:"
-        + year_group
+        + YEAR_GROUP
         + r"|"
-        + name_group
+        + NAME_GROUP
         + r"){2}"
     )
     # If there's a trailing comment marker, match that too
@@ -169,28 +214,7 @@ def _parse_copyright_string_line(
     # Mark the end of the string.
     exp += r"$"
 
-    # Search the input
-    match = re.search(re.compile(exp, re.IGNORECASE | re.MULTILINE), input)
-    if match is None:
-        return None
-
-    match_dict = match.groupdict()
-    start_year, end_year = _parse_years(match_dict["year"])
-    leading_comment = match_dict["leading_comment_marker"].strip()
-    trailing_comment = (
-        None
-        if not comment_markers[1]
-        else match_dict["trailing_comment_marker"].strip()
-    )
-
-    return ParsedCopyrightString(
-        (leading_comment, trailing_comment),
-        match_dict["signifiers"].strip(),
-        start_year,
-        end_year,
-        match_dict["name"].strip(),
-        match.group().strip(),
-    )
+    return re.compile(exp, re.IGNORECASE | re.MULTILINE)
 
 
 def parse_copyright_docstring(input: str) -> Optional[ParsedCopyrightString]:
@@ -246,6 +270,31 @@ def parse_copyright_comment(
     return copyright_strings[0]
 
 
+def get_end_year_offset(copyright_string: ParsedCopyrightString) -> int:
+    """
+    Locate the end year within the text of a parsed copyright string.
+
+    The text is matched again with the regex that parsed it, so that the same year
+    elsewhere in the string (e.g. as part of the name) is not mistaken for it.
+
+    Args:
+        copyright_string (ParsedCopyrightString): The parsed copyright string.
+
+    Returns:
+        int: the offset of the end year within `copyright_string.string`.
+    """
+    regex: re.Pattern = (
+        DOCSTRING_REGEX
+        if copyright_string.comment_markers is None
+        else _get_copyright_line_regex(copyright_string.comment_markers)
+    )
+    match = regex.search(copyright_string.string)
+    assert (
+        match is not None and match.group("year") is not None
+    ), f"Could not locate the year in '{copyright_string.string}'."
+    return match.end("year") - len(str(copyright_string.end_year))
+
+
 def _parse_years(year: str) -> Tuple[int, int]:
     """
     Parse the identified year string as a range of years.
@@ -260,14 +309,14 @@ def _parse_years(year: str) -> Tuple[int, int]:
     Raises:
         SyntaxError: When the year string cannot be parsed.
     """
-    match = re.match(r"^(?P<start_year>(\d{4}))\s*-\s*(?P<end_year>(\d{4}))", year)
+    match = YEAR_RANGE_REGEX.match(year)
     if match:
         return (
             int(match.groupdict()["start_year"]),
             int(match.groupdict()["end_year"]),
         )
 
-    match = re.match(r"^(?P<year>(\d{4}))$", year)
+    match = SINGLE_YEAR_REGEX.match(year)
     if match:
         return (int(match.groupdict()["year"]), int(match.groupdict()["year"]))
 
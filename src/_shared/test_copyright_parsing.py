@@ -38,12 +38,12 @@ class TestParsedCopyrightString:
     def test_checks_dates():
         with pytest.raises(ValueError) as e:
             _ = copyright_parsing.ParsedCopyrightString(
-                Mock(),
-                Mock(),
+                "<comment markers sentinel>",
+                "<signifiers sentinel>",
                 start_year := 9999,
                 end_year := 1111,
-                Mock(),
-                Mock(),
+                "<name sentinel>",
+                "<string sentinel>",
             )
         assert_matching(
             "Output error message",
@@ -196,12 +196,47 @@ class TestParseCopyrightDocstring:
         @staticmethod
         @pytest.mark.parametrize(
             "input_string",
-            ['"""Not a copyright string"""', '""""""', '"""\nfoo\n\nbar\n"""'],
+            [
+                '"""Not a copyright string"""',
+                '""""""',
+                '"""\nfoo\n\nbar\n"""',
+                "not a valid python file.",
+            ],
         )
         def test_returns_none_for_no_matches(input_string: str):
             assert copyright_parsing.parse_copyright_docstring(input_string) is None
 
-        @staticmethod
-        @pytest.mark.parametrize("input_string", ["not a valid python file."])
-        def test_returns_none_for_invalid_python_file(input_string: str):
-            assert copyright_parsing.parse_copyright_docstring(input_string) is None
+
+class TestGetEndYearOffset:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "comment_markers, string, expected_offset",
+        [
+            (None, "Copyright 1312 NAME", 10),
+            (None, "Copyright 1066-1312 NAME 1312", 15),
+            (None, "Copyright NAME 1312 as of 1066", 26),
+            (("#", None), "# Copyright 1312 NAME", 12),
+            (("#", None), "# Copyright 1066 - 1312 NAME 1312", 19),
+            (("<!---", "-->"), "<!--- Copyright 1312 NAME 1312 -->", 16),
+        ],
+    )
+    def test_finds_end_year(
+        comment_markers: Optional[Tuple[str, Optional[str]]],
+        string: str,
+        expected_offset: int,
+    ):
+        # GIVEN
+        parsed = copyright_parsing.ParsedCopyrightString(
+            comment_markers,
+            "<signifiers sentinel>",
+            1066,
+            int(string[expected_offset : expected_offset + 4]),
+            "<name sentinel>",
+            string,
+        )
+
+        # WHEN
+        offset = copyright_parsing.get_end_year_offset(parsed)
+
+        # THEN
+        assert offset == expected_offset
@@ -44,3 +44,24 @@ class TestResolveFiles:
         with cwd(tmp_path):
             with pytest.raises(FileNotFoundError):
                 resolvers.resolve_files(["hello.txt", "goodbye.py"])
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "missing_file", ["src/missing.py", "missing.py", "missing_dir/missing.py"]
+    )
+    def test_raises_exception_for_missing_file_among_files_in_shared_directories(
+        tmp_path, cwd, missing_file: str
+    ):
+        existing_files = ["hello.txt", "goodbye.py", "src/hello.py", "src/goodbye.py"]
+        for file in existing_files:
+            (tmp_path / file).parent.mkdir(exist_ok=True)
+            (tmp_path / file).write_text("")
+
+        with cwd(tmp_path):
+            assert resolvers.resolve_files(existing_files) == [
+                Path(file) for file in existing_files
+            ]
+            with pytest.raises(FileNotFoundError) as e:
+                resolvers.resolve_files(existing_files + [missing_file])
+
+        assert e.exconly() == f"FileNotFoundError: {missing_file}"
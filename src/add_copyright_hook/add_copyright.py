@@ -387,10 +387,11 @@ def _ensure_copyright_string(
         comment_markers: Tuple[str, Optional[str]] = get_comment_markers(file)
 
         # Early return if the file already has copyright info, either in a comment or a
-        # docstring.
-        if parse_copyright_comment(
-            content, comment_markers
-        ) or parse_copyright_docstring(content):
+        # docstring. Empty files can't, so skip parsing them.
+        if content and (
+            parse_copyright_comment(content, comment_markers)
+            or parse_copyright_docstring(content)
+        ):
             return 0
 
         print(f"Fixing file `{file}` ", end="")
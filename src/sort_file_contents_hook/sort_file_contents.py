@@ -38,7 +38,7 @@ def _sort_lines(lines: t.List[str], unique: bool = False) -> t.List[str]:
         list of str: the sorted lines.
     """
     if unique:
-        lines = list(set(lines))
+        lines = list(dict.fromkeys(lines))
 
     def _ignore_comments_in_section(input: str) -> str:
         """Key function for sorting section entries."""
@@ -120,14 +120,15 @@ def _identify_sections(lines: t.List[str]) -> t.List[t.List[str]]:
     return sections
 
 
-def _find_duplicates(lines: t.List[str]) -> t.List[t.Tuple[str, int]]:
+def _find_duplicates(lines: t.Iterable[str]) -> t.List[t.Tuple[str, int]]:
     """
-    Identify duplicate entries in the list.
+    Identify duplicate entries in the iterable.
 
     'None' entries are not counted as duplicates.
 
     Arguments:
-        lines: the list of strings to check for duplicates.
+        lines: the strings to check for duplicates. Any iterable is accepted, so
+            callers need not materialise a list first.
 
     Returns:
         list(tuple(str, int)): a list of tuples containing the duplicated string, and
@@ -139,18 +140,21 @@ def _find_duplicates(lines: t.List[str]) -> t.List[t.Tuple[str, int]]:
     return duplicates
 
 
-def _find_comment_clashes(lines: t.List[str]) -> t.List[str]:
+def _find_comment_clashes(lines: t.Iterable[str]) -> t.List[str]:
     """
-    Identify duplicate entries in the list where one of the entries is commented out.
+    Identify entries that clash once comment markers are disregarded.
+
+    Spaces and '#' are stripped from both ends of each line before looking for
+    duplicates, so an entry that appears both commented out and uncommented is
+    reported, as are entries differing only in surrounding spaces or '#'.
 
     Args:
-        lines: the list of strings to check for duplicates.
+        lines: the strings to check for clashes.
 
     Returns:
-        list(str): a list of duplicated strings.
+        list(str): the stripped entries that occur more than once.
     """
-    lines = [line.strip(" #") for line in lines]
-    duplicates = _find_duplicates(lines)
+    duplicates = _find_duplicates(line.strip(" #") for line in lines)
     return [duplicate[0] for duplicate in duplicates]
 
 
@@ -187,10 +191,8 @@ def _sort_contents(file: Path, unique: bool = False) -> int:
     # Check for uniqueness
     if unique:
         duplicates: t.List[t.Tuple[str, int]] = _find_duplicates(
-            list(
-                itertools.chain.from_iterable(
-                    [contents for contents in section_contents if contents is not None]
-                )
+            itertools.chain.from_iterable(
+                contents for contents in section_contents if contents is not None
             )
         )
         if len(duplicates) > 0:
@@ -203,10 +205,8 @@ def _sort_contents(file: Path, unique: bool = False) -> int:
             raise UnsortableError(err_msg)
 
         comment_clashes: t.List[str] = _find_comment_clashes(
-            list(
-                itertools.chain.from_iterable(
-                    [contents for contents in section_contents if contents is not None]
-                )
+            itertools.chain.from_iterable(
+                contents for contents in section_contents if contents is not None
             )
         )
         if len(comment_clashes) > 0:
@@ -12,11 +12,15 @@ consult the README file.
 import argparse
 import datetime
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, FrozenSet, Optional, Tuple
+
+from identify import identify
 
 from src._shared import resolvers
 from src._shared.comment_mapping import get_comment_markers
 from src._shared.copyright_parsing import (
+    COPYRIGHT_SIGNIFIERS,
+    get_end_year_offset,
     parse_copyright_comment,
     parse_copyright_docstring,
 )
@@ -25,8 +29,46 @@ REMOVED_COLOUR: str = "\033[91m"
 ADDED_COLOUR: str = "\033[92m"
 END_COLOUR: str = "\033[0m"
 
+ENCODING: str = "utf-8"
+
+# The copyright signifiers, at least one of which must be present for a copyright
+# string to parse. These are encoded so that files can be checked before they are
+# decoded.
+SIGNIFIERS: Tuple[bytes, ...] = tuple(
+    signifier.encode(ENCODING) for signifier in COPYRIGHT_SIGNIFIERS
+)
+
+# Comment markers already resolved during this run, keyed by filename-derived tags.
+_COMMENT_MARKERS_CACHE: Dict[FrozenSet[str], Tuple[str, Optional[str]]] = {}
+
+
+def _get_comment_markers(file: Path) -> Tuple[str, Optional[str]]:
+    """
+    Get the comment markers for the file, reusing earlier lookups where possible.
+
+    The markers only depend on the language tags that identify derives from the file
+    name, so files sharing those tags (e.g. every `.py` file) share a single lookup.
+    Files that can only be identified by their contents (i.e. by shebang) are looked
+    up every time.
+
+    Args:
+        file (Path): the file to get comment markers for.
+
+    Raises:
+        NotImplementedError: When the file is not a format we support.
+
+    Returns:
+        tuple(str, str|None): The leading and trailing comment markers.
+    """
+    tags: FrozenSet[str] = frozenset(identify.tags_from_filename(file.name))
+    if not tags:
+        return get_comment_markers(file)
+    if tags not in _COMMENT_MARKERS_CACHE:
+        _COMMENT_MARKERS_CACHE[tags] = get_comment_markers(file)
+    return _COMMENT_MARKERS_CACHE[tags]
+
 
-def _update_copyright_dates(file: Path) -> int:
+def _update_copyright_dates(file: Path, current_year: int) -> int:
     """
     Ensure that if the file has a copyright string, the end date matches the current year.
 
@@ -34,52 +76,89 @@ def _update_copyright_dates(file: Path) -> int:
 
     Args:
         file (path): the file to be checked.
+        current_year (int): the year that copyright strings should extend to.
 
     Returns:
         int: 0 if the file already had an up to date copyright string or had no
-            copyright string, 1 if a copyright string had to be added.
+            copyright string, 1 if a copyright string had to be updated or is out of
+            date but could not be located in the file.
     """
-    with open(file, "r+") as f:
-        content: str = f.read()
-        comment_markers: Tuple[str, Optional[str]] = get_comment_markers(file)
-
-        # Early return for no copyright string in file
-        if not (
-            copyright_string := parse_copyright_comment(content, comment_markers)
-            or parse_copyright_docstring(content)
-        ):
-            return 0
-
-        # Early return for up to date copyright string
-        if copyright_string.end_year == (
-            copyright_end_year := datetime.date.today().year
-        ):
-            return 0
-
-        print(f"Fixing file `{file}`:")
-
-        new_copyright_string: str
-        # Generate new copyright string
+    raw_content: bytes = file.read_bytes()
+    comment_markers: Tuple[str, Optional[str]] = _get_comment_markers(file)
+
+    # Early return for files that can't contain a copyright string. This is much
+    # cheaper than decoding the file and running the parsers, and is the common case.
+    lowered_raw_content: bytes = raw_content.lower()
+    if not any(signifier in lowered_raw_content for signifier in SIGNIFIERS):
+        return 0
+
+    # Decoding the raw bytes skips newline translation, so character offsets into the
+    # content map directly onto the file and line endings are preserved on write.
+    content: str = raw_content.decode(ENCODING)
+
+    # Early return for no copyright string in file
+    if not (
+        copyright_string := parse_copyright_comment(content, comment_markers)
+        or parse_copyright_docstring(content)
+    ):
+        return 0
+
+    # Early return for up to date copyright string
+    if copyright_string.end_year == current_year:
+        return 0
+
+    end_year_string: str = str(copyright_string.end_year)
+    current_year_string: str = str(current_year)
+
+    # Locate the end year within the file so that we only touch those characters.
+    # Docstrings are parsed from their evaluated text, which can differ from the source
+    # (e.g. escape sequences), in which case the file can't be updated automatically.
+    string_offset: int = content.find(copyright_string.string)
+    if string_offset < 0:
+        print(
+            f"Could not update file `{file}`, please update its copyright string "
+            f"manually:\n{REMOVED_COLOUR}  - {copyright_string.string}{END_COLOUR}"
+        )
+        return 1
+    year_offset: int = string_offset + get_end_year_offset(copyright_string)
+    year_end_offset: int = year_offset + len(end_year_string)
+    year_start_in_string: int = year_offset - string_offset
+    year_end_in_string: int = year_end_offset - string_offset
+
+    new_copyright_string: str
+    with open(file, "r+b") as f:
         if copyright_string.start_year != copyright_string.end_year:
-            # multiple dates in copyright string
-            new_copyright_string = copyright_string.string.replace(
-                str(copyright_string.end_year), str(copyright_end_year)
+            # multiple dates in copyright string: the end year is overwritten in place,
+            # as the new year is the same width as the old one.
+            new_copyright_string = (
+                copyright_string.string[:year_start_in_string]
+                + current_year_string
+                + copyright_string.string[year_end_in_string:]
             )
+            f.seek(len(content[:year_offset].encode(ENCODING)))
+            f.write(current_year_string.encode(ENCODING))
         else:
-            # single date in copyright string
-            new_copyright_string = copyright_string.string.replace(
-                str(copyright_string.end_year),
-                f"{copyright_string.end_year}-{copyright_end_year}",
+            # single date in copyright string: the file grows, so rewrite from the
+            # year onwards.
+            new_copyright_string = (
+                copyright_string.string[:year_end_in_string]
+                + f"-{current_year_string}"
+                + copyright_string.string[year_end_in_string:]
+            )
+            f.seek(len(content[:year_end_offset].encode(ENCODING)))
+            f.truncate()
+            f.write(
+                f"-{current_year_string}{content[year_end_offset:]}".encode(ENCODING)
             )
 
-        f.seek(0, 0)
-        f.truncate()
-        f.write(content.replace(copyright_string.string, new_copyright_string))
-
-        print(f"{REMOVED_COLOUR}  - {copyright_string.string}{END_COLOUR}")
-        print(f"{ADDED_COLOUR}  + {new_copyright_string}{END_COLOUR}")
+    # Report the change in a single write.
+    print(
+        f"Fixing file `{file}`:\n"
+        f"{REMOVED_COLOUR}  - {copyright_string.string}{END_COLOUR}\n"
+        f"{ADDED_COLOUR}  + {new_copyright_string}{END_COLOUR}"
+    )
 
-        return 1
+    return 1
 
 
 def _parse_args() -> argparse.Namespace:
@@ -95,8 +174,9 @@ def _parse_args() -> argparse.Namespace:
 
     args = parser.parse_args()
 
-    # Check that files exist
-    args.files = resolvers.resolve_files(args.files)
+    # Check that files exist, skipping the check when there are none.
+    if args.files:
+        args.files = resolvers.resolve_files(args.files)
 
     return args
 
@@ -112,10 +192,11 @@ def main():
         int: 1 if files have been modified, 0 otherwise.
     """
     files = _parse_args().files
+    current_year: int = datetime.date.today().year
 
     retv: int = 0
     for file in files:
-        retv |= _update_copyright_dates(file)
+        retv |= _update_copyright_dates(file, current_year)
 
     return retv
 
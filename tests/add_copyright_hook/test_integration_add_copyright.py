@@ -15,12 +15,24 @@ from conftest import (
     SupportedLanguage,
     add_changed_files,
     assert_matching,
+    set_git_identity,
     write_config_file,
 )
 from src._shared.exceptions import InvalidConfigError
 from src.add_copyright_hook import add_copyright
 from src.add_copyright_hook.add_copyright import InvalidGitRepositoryError
 
+VALID_COPYRIGHT_STRINGS = [
+    s.format(end_year="1312") for s in CopyrightGlobals.VALID_COPYRIGHT_STRINGS
+]
+# The copyright strings the hook should add by default, keyed by file extension.
+DEFAULT_COPYRIGHT_STRINGS = {
+    lang.extension: lang.comment_format.format(
+        content="Copyright (c) 1312 <git config username sentinel>"
+    )
+    for lang in CopyrightGlobals.SUPPORTED_LANGUAGES
+}
+
 
 class TestMeta:
     @staticmethod
@@ -56,10 +68,7 @@ class TestNoChanges:
 
     @staticmethod
     @pytest.mark.parametrize("language", CopyrightGlobals.SUPPORTED_LANGUAGES)
-    @pytest.mark.parametrize(
-        "copyright_string",
-        [s.format(end_year="1312") for s in CopyrightGlobals.VALID_COPYRIGHT_STRINGS],
-    )
+    @pytest.mark.parametrize("copyright_string", VALID_COPYRIGHT_STRINGS)
     def test_all_changed_files_have_copyright(
         capsys: CaptureFixture,
         copyright_string: str,
@@ -85,8 +94,7 @@ class TestNoChanges:
 
         # THEN
         # Gather actual outputs
-        with open(git_repo.workspace / file, "r") as f:
-            output_content = f.read()
+        output_content = (git_repo.workspace / file).read_text()
         captured = capsys.readouterr()
 
         # Compare
@@ -98,10 +106,7 @@ class TestNoChanges:
 
     @staticmethod
     @pytest.mark.parametrize("language", CopyrightGlobals.DOCSTR_SUPPORTED_LANGUAGES)
-    @pytest.mark.parametrize(
-        "copyright_string",
-        [s.format(end_year="1312") for s in CopyrightGlobals.VALID_COPYRIGHT_STRINGS],
-    )
+    @pytest.mark.parametrize("copyright_string", VALID_COPYRIGHT_STRINGS)
     @pytest.mark.parametrize("docstring_additional_text", ["", "\nblah", "\n\nblah"])
     def test_files_have_docstring_copyright_info(
         capsys: CaptureFixture,
@@ -128,8 +133,7 @@ class TestNoChanges:
 
         # THEN
         # Gather actual outputs
-        with open(git_repo.workspace / file, "r") as f:
-            output_content = f.read()
+        output_content = (git_repo.workspace / file).read_text()
         captured = capsys.readouterr()
 
         # Compare
@@ -162,8 +166,7 @@ class TestDefaultBehavior:
             add_changed_files(
                 file := "hello" + language.extension, "", git_repo, mocker
             )
-            git_repo.run(f"git config user.name '{git_username}'")
-            git_repo.run("git config user.email 'you@example.com'")
+            set_git_identity(git_repo, git_username, "you@example.com")
 
             # WHEN
             with cwd(git_repo.workspace):
@@ -178,8 +181,7 @@ class TestDefaultBehavior:
             expected_stdout = f"Fixing file `hello{language.extension}` - added line(s):\n{copyright_string}\n"  # noqa: E501
 
             # Gather actual outputs
-            with open(git_repo.workspace / file, "r") as f:
-                output_content = f.read()
+            output_content = (git_repo.workspace / file).read_text()
             captured = capsys.readouterr()
 
             # Compare
@@ -207,8 +209,7 @@ class TestDefaultBehavior:
             add_changed_files(
                 file := "hello" + language.extension, "", git_repo, mocker
             )
-            git_repo.run(f"git config user.name '{git_username}'")
-            git_repo.run("git config user.email 'you@example.com'")
+            set_git_identity(git_repo, git_username, "you@example.com")
             (git_repo.workspace / config_file).write_text("[tool.foo]\noption='value'")
 
             # WHEN
@@ -224,8 +225,7 @@ class TestDefaultBehavior:
             expected_stdout = f"Fixing file `hello{language.extension}` - added line(s):\n{copyright_string}\n"  # noqa: E501
 
             # Gather actual outputs
-            with open(git_repo.workspace / file, "r") as f:
-                output_content = f.read()
+            output_content = (git_repo.workspace / file).read_text()
             captured = capsys.readouterr()
 
             # Compare
@@ -255,8 +255,7 @@ class TestDefaultBehavior:
                 git_repo,
                 mocker,
             )
-            git_repo.run(f"git config user.name '{git_username}'")
-            git_repo.run("git config user.email 'you@example.com'")
+            set_git_identity(git_repo, git_username, "you@example.com")
 
             # WHEN
             with cwd(git_repo.workspace):
@@ -273,8 +272,7 @@ class TestDefaultBehavior:
             expected_stdout = f"Fixing file `hello{language.extension}` - added line(s):\n{copyright_string}\n"  # noqa: E501
 
             # Gather actual outputs
-            with open(git_repo.workspace / file, "r") as f:
-                output_content = f.read()
+            output_content = (git_repo.workspace / file).read_text()
             captured = capsys.readouterr()
 
             # Compare
@@ -308,8 +306,7 @@ class TestDefaultBehavior:
             add_changed_files(
                 file := "hello" + language.extension, file_content, git_repo, mocker
             )
-            git_repo.run(f"git config user.name '{git_username}'")
-            git_repo.run("git config user.email 'you@example.com'")
+            set_git_identity(git_repo, git_username, "you@example.com")
 
             # WHEN
             with cwd(git_repo.workspace):
@@ -332,8 +329,7 @@ class TestDefaultBehavior:
             )
 
             # Gather actual outputs
-            with open(git_repo.workspace / file, "r") as f:
-                output_content = f.read()
+            output_content = (git_repo.workspace / file).read_text()
             captured = capsys.readouterr()
 
             # Compare
@@ -367,9 +363,8 @@ class TestDefaultBehavior:
                 git_repo,
                 mocker,
             )
-            git_repo.run(f"git config user.name '{git_username}'")
-            git_repo.run("git config user.email 'you@example.com'")
-            git_repo.run(f"git add {file}", check_rc=True)
+            set_git_identity(git_repo, git_username, "you@example.com")
+            # add_changed_files has already staged the file.
             git_repo.run("git commit -m 'test commit' --no-verify", check_rc=True)
 
             # WHEN
@@ -387,8 +382,7 @@ class TestDefaultBehavior:
             )
 
             # Gather actual outputs
-            with open(git_repo.workspace / file, "r") as f:
-                output_content = f.read()
+            output_content = (git_repo.workspace / file).read_text()
             captured = capsys.readouterr()
 
             # Compare
@@ -435,8 +429,7 @@ class TestCustomBehavior:
                 )
 
                 # Gather actual outputs
-                with open(git_repo.workspace / file, "r") as f:
-                    output_content = f.read()
+                output_content = (git_repo.workspace / file).read_text()
                 captured = capsys.readouterr()
 
                 # Compare
@@ -491,8 +484,7 @@ class TestCustomBehavior:
                 )
 
                 # Gather actual outputs
-                with open(git_repo.workspace / file, "r") as f:
-                    output_content = f.read()
+                output_content = (git_repo.workspace / file).read_text()
                 captured = capsys.readouterr()
 
                 # Compare
@@ -543,8 +535,7 @@ class TestCustomBehavior:
                 )
 
                 # Gather actual outputs
-                with open(git_repo.workspace / file, "r") as f:
-                    output_content = f.read()
+                output_content = (git_repo.workspace / file).read_text()
                 captured = capsys.readouterr()
 
                 # Compare
@@ -591,8 +582,7 @@ class TestCustomBehavior:
                 )
 
                 # Gather actual outputs
-                with open(git_repo.workspace / file, "r") as f:
-                    output_content = f.read()
+                output_content = (git_repo.workspace / file).read_text()
                 captured = capsys.readouterr()
 
                 # Compare
@@ -657,8 +647,7 @@ class TestCustomBehavior:
                 )
 
                 # Gather actual outputs
-                with open(git_repo.workspace / file, "r") as f:
-                    output_content = f.read()
+                output_content = (git_repo.workspace / file).read_text()
                 captured = capsys.readouterr()
 
                 # Compare
@@ -707,8 +696,7 @@ class TestCustomBehavior:
                 )
 
                 # Gather actual outputs
-                with open(git_repo.workspace / file, "r") as f:
-                    output_content = f.read()
+                output_content = (git_repo.workspace / file).read_text()
                 captured = capsys.readouterr()
 
                 # Compare
@@ -779,14 +767,11 @@ class TestCustomBehavior:
                         )
                     else:
                         # Otherwise we expect the default copyright format.
-                        copyright_string = lang.comment_format.format(
-                            content="Copyright (c) {year} {name}".format(
-                                name="<git config username sentinel>", year="1312"
-                            )
-                        )
+                        copyright_string = DEFAULT_COPYRIGHT_STRINGS[lang.extension]
 
-                    with open(git_repo.workspace / f"hello{lang.extension}", "r") as f:
-                        output_content = f.read()
+                    output_content = (
+                        git_repo.workspace / f"hello{lang.extension}"
+                    ).read_text()
                     assert_matching(
                         "output content",
                         "expected content",
@@ -839,14 +824,11 @@ class TestCustomBehavior:
                         )
                     else:
                         # Otherwise we expect the default copyright format.
-                        copyright_string = lang.comment_format.format(
-                            content="Copyright (c) {year} {name}".format(
-                                name="<git config username sentinel>", year="1312"
-                            )
-                        )
+                        copyright_string = DEFAULT_COPYRIGHT_STRINGS[lang.extension]
 
-                    with open(git_repo.workspace / f"hello{lang.extension}", "r") as f:
-                        output_content = f.read()
+                    output_content = (
+                        git_repo.workspace / f"hello{lang.extension}"
+                    ).read_text()
                     assert_matching(
                         "output content",
                         "expected content",
@@ -895,8 +877,9 @@ class TestCustomBehavior:
                     assert add_copyright.main() == 1
 
                 # THEN
-                with open(git_repo.workspace / f"hello{language.extension}", "r") as f:
-                    output_content = f.read()
+                output_content = (
+                    git_repo.workspace / f"hello{language.extension}"
+                ).read_text()
                 assert_matching(
                     "output content",
                     "expected content",
@@ -937,8 +920,9 @@ class TestCustomBehavior:
                     assert add_copyright.main() == 1
 
                 # THEN
-                with open(git_repo.workspace / f"hello{language.extension}", "r") as f:
-                    output_content = f.read()
+                output_content = (
+                    git_repo.workspace / f"hello{language.extension}"
+                ).read_text()
                 assert_matching(
                     "output content",
                     "expected content",
@@ -949,78 +933,93 @@ class TestCustomBehavior:
 
 class TestFailureStates:
     class TestConfigFailures:
-        @pytest.mark.parametrize("config_file", ["pyproject.toml"])
-        class TestTomlFailures:
-            @staticmethod
-            @pytest.mark.parametrize(
-                "config_file_content",
-                [
+        @staticmethod
+        @pytest.mark.parametrize(
+            "config_file, config_file_content",
+            [
+                (
+                    "pyproject.toml",
                     '[tool.add_copyright]\nunsupported_option="should not matter"\n',
+                ),
+                (
+                    "pyproject.toml",
                     '[tool.add_copyright.unsupported_option]\nname="foo"\n',
-                ],
+                ),
+                (
+                    "setup.cfg",
+                    '[tool.add_copyright]\nunsupported_option="should not matter"\n',
+                ),
+            ],
+        )
+        def test_raises_KeyError_for_unsupported_config_options(
+            cwd,
+            git_repo: GitRepo,
+            config_file: str,
+            config_file_content: str,
+            mocker: MockerFixture,
+        ):
+            # GIVEN
+            add_changed_files("hello.py", "", git_repo, mocker)
+            config_file_path = write_config_file(
+                git_repo.workspace, config_file, config_file_content
             )
-            def test_raises_KeyError_for_unsupported_config_options(
-                cwd,
-                git_repo: GitRepo,
-                config_file: str,
-                config_file_content: str,
-                mocker: MockerFixture,
-            ):
-                # GIVEN
-                add_changed_files("hello.py", "", git_repo, mocker)
-                config_file_path = write_config_file(
-                    git_repo.workspace, config_file, config_file_content
-                )
 
-                # WHEN
-                with cwd(git_repo.workspace):
-                    with pytest.raises(KeyError) as e:
-                        add_copyright.main()
+            # WHEN
+            with cwd(git_repo.workspace):
+                with pytest.raises(KeyError) as e:
+                    add_copyright.main()
 
-                # THEN
-                expected_error_string: str = (
-                    'KeyError: "Unsupported option in config file '
-                    + (str(Path("/private")) if "/private" in e.exconly() else "")
-                    + f"{git_repo.workspace/ config_file_path}: 'unsupported_option'. "
-                    "Supported options are: "
-                    f'{CopyrightGlobals.SUPPORTED_TOP_LEVEL_CONFIG_OPTIONS}."'
-                )
+            # THEN
+            error_string = e.exconly()
+            private_prefix = "/private" if "/private" in error_string else ""
+            expected_error_string: str = (
+                'KeyError: "Unsupported option in config file '
+                + private_prefix
+                + f"{git_repo.workspace/ config_file_path}: 'unsupported_option'. "
+                "Supported options are: "
+                f'{CopyrightGlobals.SUPPORTED_TOP_LEVEL_CONFIG_OPTIONS}."'
+            )
 
-                assert_matching(
-                    "Output error string",
-                    "Expected error string",
-                    e.exconly(),
-                    expected_error_string,
-                )
+            assert_matching(
+                "Output error string",
+                "Expected error string",
+                error_string,
+                expected_error_string,
+            )
 
-            @staticmethod
-            def test_raises_error_for_invalid_toml(
-                cwd, git_repo: GitRepo, mocker: MockerFixture, config_file: str
-            ):
-                # GIVEN
-                language = CopyrightGlobals.SUPPORTED_LANGUAGES[0]
-                add_changed_files("hello" + language.extension, "", git_repo, mocker)
-                file = write_config_file(
-                    git_repo.workspace,
-                    config_file,
-                    "[not]valid\ntoml",
-                )
+        @staticmethod
+        @pytest.mark.parametrize("config_file", ["pyproject.toml", "setup.cfg"])
+        def test_raises_error_for_invalid_syntax(
+            cwd, git_repo: GitRepo, mocker: MockerFixture, config_file: str
+        ):
+            # GIVEN
+            language = CopyrightGlobals.SUPPORTED_LANGUAGES[0]
+            add_changed_files("hello" + language.extension, "", git_repo, mocker)
+            file = write_config_file(
+                git_repo.workspace,
+                config_file,
+                "[not]valid\ntoml",
+            )
 
-                # WHEN
-                with cwd(git_repo.workspace):
-                    with pytest.raises(InvalidConfigError) as e:
-                        add_copyright.main()
+            # WHEN
+            with cwd(git_repo.workspace):
+                with pytest.raises(InvalidConfigError) as e:
+                    add_copyright.main()
 
-                # THEN
-                assert_matching(
-                    "Output error string",
-                    "Expected error string",
-                    e.exconly(),
-                    "src._shared.exceptions.InvalidConfigError: Could not parse config file '"  # noqa: E501
-                    + (str(Path("/private")) if "/private" in e.exconly() else "")
-                    + f"{file}'.",
-                )
+            # THEN
+            error_string = e.exconly()
+            private_prefix = "/private" if "/private" in error_string else ""
+            assert_matching(
+                "Output error string",
+                "Expected error string",
+                error_string,
+                "src._shared.exceptions.InvalidConfigError: Could not parse config file '"  # noqa: E501
+                + private_prefix
+                + f"{file}'.",
+            )
 
+        @pytest.mark.parametrize("config_file", ["pyproject.toml"])
+        class TestTomlFailures:
             @staticmethod
             @pytest.mark.parametrize(
                 "config_file_content",
@@ -1051,9 +1050,11 @@ class TestFailureStates:
                         add_copyright.main()
 
                 # THEN
+                error_string = e.exconly()
+                private_prefix = "/private" if "/private" in error_string else ""
                 expected_error_string: str = (
                     'KeyError: "Unsupported option in config file '
-                    + (str(Path("/private")) if "/private" in e.exconly() else "")
+                    + private_prefix
                     + f"{git_repo.workspace/ config_file_path}: "
                     f"'{language.toml_key}.unsupported_option'. "
                     f"Supported options for '{language.toml_key}' are: "
@@ -1062,7 +1063,7 @@ class TestFailureStates:
                 assert_matching(
                     "Output error string",
                     "Expected error string",
-                    e.exconly(),
+                    error_string,
                     expected_error_string,
                 )
 
@@ -1106,77 +1107,6 @@ class TestFailureStates:
                     f"KeyError: \"The format string '{input_format}' is missing the following required keys: ['{missing_keys}']\"",  # noqa: E501
                 )
 
-        @pytest.mark.parametrize("config_file", ["setup.cfg"])
-        class TestCFGFailures:
-            @staticmethod
-            @pytest.mark.parametrize(
-                "config_file_content",
-                [
-                    '[tool.add_copyright]\nunsupported_option="should not matter"\n',
-                ],
-            )
-            def test_raises_KeyError_for_unsupported_config_options(
-                cwd,
-                git_repo: GitRepo,
-                config_file: str,
-                config_file_content: str,
-                mocker: MockerFixture,
-            ):
-                # GIVEN
-                add_changed_files("hello.py", "", git_repo, mocker)
-                config_file_path = write_config_file(
-                    git_repo.workspace, config_file, config_file_content
-                )
-
-                # WHEN
-                with cwd(git_repo.workspace):
-                    with pytest.raises(KeyError) as e:
-                        add_copyright.main()
-
-                # THEN
-                expected_error_string: str = (
-                    'KeyError: "Unsupported option in config file '
-                    + (str(Path("/private")) if "/private" in e.exconly() else "")
-                    + f"{git_repo.workspace/ config_file_path}: 'unsupported_option'. "
-                    "Supported options are: "
-                    f'{CopyrightGlobals.SUPPORTED_TOP_LEVEL_CONFIG_OPTIONS}."'
-                )
-
-                assert_matching(
-                    "Output error string",
-                    "Expected error string",
-                    e.exconly(),
-                    expected_error_string,
-                )
-
-            @staticmethod
-            def test_raises_error_for_invalid_syntax(
-                cwd, git_repo: GitRepo, mocker: MockerFixture, config_file: str
-            ):
-                # GIVEN
-                language = CopyrightGlobals.SUPPORTED_LANGUAGES[0]
-                add_changed_files("hello" + language.extension, "", git_repo, mocker)
-                file = write_config_file(
-                    git_repo.workspace,
-                    config_file,
-                    "[not]valid\ntoml",
-                )
-
-                # WHEN
-                with cwd(git_repo.workspace):
-                    with pytest.raises(InvalidConfigError) as e:
-                        add_copyright.main()
-
-                # THEN
-                assert_matching(
-                    "Output error string",
-                    "Expected error string",
-                    e.exconly(),
-                    "src._shared.exceptions.InvalidConfigError: Could not parse config file '"  # noqa: E501
-                    + (str(Path("/private")) if "/private" in e.exconly() else "")
-                    + f"{file}'.",
-                )
-
     class TestInputFileFailures:
         @staticmethod
         @pytest.mark.parametrize("language", CopyrightGlobals.SUPPORTED_LANGUAGES)
@@ -1315,7 +1245,7 @@ class TestGitRepoErrors:
             git_repo,
             mocker,
         )
-        git_repo.run('git config user.name ""')
+        set_git_identity(git_repo, "")
 
         # WHEN / THEN
         with cwd(git_repo.workspace):
@@ -13,6 +13,7 @@ from conftest import (
     SupportedLanguage,
     add_changed_files,
     assert_matching,
+    set_git_identity,
     write_config_file,
 )
 
@@ -52,8 +53,7 @@ class TestNoChanges:
         # THEN
         assert process.returncode == 0, process.stdout + process.stderr
         for file in files:
-            with open(git_repo.workspace / file, "r") as f:
-                content = f.read()
+            content = (git_repo.workspace / file).read_text()
             assert content == f"<file {file} content sentinel>"
         assert "Add copyright string to source files" in process.stdout
         assert "Passed" in process.stdout
@@ -91,8 +91,7 @@ class TestNoChanges:
 
         # THEN
         assert process.returncode == 0, process.stdout + process.stderr
-        with open(git_repo.workspace / file, "r") as f:
-            output_content = f.read()
+        output_content = (git_repo.workspace / file).read_text()
         assert_matching(
             "output content", "expected content", output_content, file_content
         )
@@ -116,7 +115,7 @@ class TestDefaultBehavior:
             about overwriting or corrupting content.
             """
             # GIVEN
-            git_repo.run(f"git config user.name '{git_username}'")
+            set_git_identity(git_repo, git_username)
             add_changed_files(
                 [
                     f"hello{lang.extension}"
@@ -144,8 +143,7 @@ class TestDefaultBehavior:
                 expected_stdout = (
                     f"Fixing file `{file}` - added line(s):\n{copyright_string}\n"
                 )
-                with open(git_repo.workspace / file, "r") as f:
-                    output_content = f.read()
+                output_content = (git_repo.workspace / file).read_text()
 
                 assert_matching(
                     "output content",
@@ -163,7 +161,7 @@ class TestDefaultBehavior:
             git_username: str,
         ):
             # GIVEN
-            git_repo.run(f"git config user.name '{git_username}'")
+            set_git_identity(git_repo, git_username)
             add_changed_files(
                 [
                     f"hello{lang.extension}"
@@ -195,8 +193,7 @@ class TestDefaultBehavior:
                 expected_stdout = (
                     f"Fixing file `{file}` - added line(s):\n{copyright_string}\n"
                 )
-                with open(git_repo.workspace / file, "r") as f:
-                    output_content = f.read()
+                output_content = (git_repo.workspace / file).read_text()
 
                 assert_matching(
                     "output content",
@@ -213,7 +210,7 @@ class TestDefaultBehavior:
             git_username: str,
         ):
             # GIVEN
-            git_repo.run(f"git config user.name '{git_username}'")
+            set_git_identity(git_repo, git_username)
             add_changed_files(
                 [
                     f"hello{lang.extension}"
@@ -249,8 +246,7 @@ class TestDefaultBehavior:
                 expected_stdout = (
                     f"Fixing file `{file}` - added line(s):\n{copyright_string}\n"
                 )
-                with open(git_repo.workspace / file, "r") as f:
-                    output_content = f.read()
+                output_content = (git_repo.workspace / file).read_text()
 
                 assert_matching(
                     "output content",
@@ -312,8 +308,7 @@ class TestCustomBehavior:
                     expected_stdout = (
                         f"Fixing file `{file}` - added line(s):\n{copyright_string}\n"
                     )
-                    with open(git_repo.workspace / file, "r") as f:
-                        output_content = f.read()
+                    output_content = (git_repo.workspace / file).read_text()
 
                     assert_matching(
                         "output content",
@@ -375,8 +370,7 @@ class TestCustomBehavior:
                         f"Fixing file `{file}` - added line(s):\n{copyright_string}\n"
                     )
 
-                    with open(git_repo.workspace / file, "r") as f:
-                        output_content = f.read()
+                    output_content = (git_repo.workspace / file).read_text()
 
                     assert_matching(
                         "output content",
@@ -426,8 +420,7 @@ class TestCustomBehavior:
                     expected_stdout = (
                         f"Fixing file `{file}` - added line(s):\n{copyright_string}\n"
                     )
-                    with open(git_repo.workspace / file, "r") as f:
-                        output_content = f.read()
+                    output_content = (git_repo.workspace / file).read_text()
 
                     assert_matching(
                         "output content",
@@ -475,8 +468,7 @@ class TestCustomBehavior:
                     expected_stdout = (
                         f"Fixing file `{file}` - added line(s):\n{copyright_string}\n"
                     )
-                    with open(git_repo.workspace / file, "r") as f:
-                        output_content = f.read()
+                    output_content = (git_repo.workspace / file).read_text()
 
                     assert_matching(
                         "output content",
@@ -601,9 +593,7 @@ class TestFailureStates:
             # THEN
             assert process.returncode == 1, process.stdout + process.stderr
             expected_stdout = f"KeyError: \"The format string '{input_format}' is missing the following required keys: ['{missing_keys}']\""  # noqa: E501
-            print("E:", expected_stdout)
-            print("R:", process.stdout)
-            assert expected_stdout in process.stdout
+            assert expected_stdout in process.stdout, process.stdout
 
     class TestInputFileFailures:
         @staticmethod
@@ -65,8 +65,7 @@ class TestNoChanges:
             assert add_msg_issue.main() == 0
 
         # THEN
-        with open(file) as f:
-            content = f.read()
+        content = file.read_text()
 
         assert_matching("output content", "expected content", content, file_content)
         captured = capsys.readouterr()
@@ -112,8 +111,7 @@ class TestAddingMessage:
             assert add_msg_issue.main() == 0
 
         # THEN
-        with open(file) as f:
-            content = f.read()
+        content = file.read_text()
 
         assert_matching("output content", "expected content", content, f"[{issue}]")
         captured = capsys.readouterr()
@@ -142,8 +140,7 @@ class TestAddingMessage:
             assert add_msg_issue.main() == 0
 
         # THEN
-        with open(file) as f:
-            content = f.read()
+        content = file.read_text()
 
         expected_file_content = f"<msg file content sentinel>\n\n[{issue}]"
         assert_matching(
@@ -175,8 +172,7 @@ class TestAddingMessage:
             assert add_msg_issue.main() == 0
 
         # THEN
-        with open(file) as f:
-            content = f.read()
+        content = file.read_text()
 
         expected_file_content = f"<summary line sentinel>\n\n[{issue}]\n<body sentinel>"
         assert_matching(
@@ -208,8 +204,7 @@ class TestAddingMessage:
             assert add_msg_issue.main() == 0
 
         # THEN
-        with open(file) as f:
-            content = f.read()
+        content = file.read_text()
 
         expected_file_content = f"{file_content}\n[{issue}]"
         assert_matching(
@@ -241,8 +236,7 @@ class TestAddingMessage:
             assert add_msg_issue.main() == 0
 
         # THEN
-        with open(file) as f:
-            content = f.read()
+        content = file.read_text()
 
         expected_file_content = (
             f"<summary line sentinel>\n\n[{issue}]\n\n# <body sentinel>"
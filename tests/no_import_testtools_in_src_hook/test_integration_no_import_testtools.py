@@ -57,8 +57,7 @@ class TestNoChanges:
 
         # THEN
         # Gather actual outputs
-        with open(git_repo.workspace / file, "r") as f:
-            output_content = f.read()
+        output_content = (git_repo.workspace / file).read_text()
         captured = capsys.readouterr()
 
         # Compare
@@ -91,8 +90,7 @@ class TestNoChanges:
 
         # THEN
         # Gather actual outputs
-        with open(git_repo.workspace / file, "r") as f:
-            output_content = f.read()
+        output_content = (git_repo.workspace / file).read_text()
         captured = capsys.readouterr()
 
         # Compare
@@ -123,8 +121,7 @@ class TestNoChanges:
 
         # THEN
         # Gather actual outputs
-        with open(git_repo.workspace / file, "r") as f:
-            output_content = f.read()
+        output_content = (git_repo.workspace / file).read_text()
         captured = capsys.readouterr()
 
         # Compare
@@ -176,8 +173,7 @@ class TestDetection:
 
         # THEN
         # Gather actual outputs
-        with open(git_repo.workspace / file, "r") as f:
-            output_content = f.read()
+        output_content = (git_repo.workspace / file).read_text()
         captured = capsys.readouterr()
 
         # Compare
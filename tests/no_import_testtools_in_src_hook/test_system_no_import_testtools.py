@@ -39,8 +39,7 @@ class TestNoChanges:
 
         # THEN
         assert process.returncode == 0, process.stdout + process.stderr
-        with open(f, "r") as file:
-            content = file.read()
+        content = f.read_text()
         assert content == "<file content sentinel>"
         assert "Detect test tool imports in src files" in process.stdout
         assert "Passed" in process.stdout, process.stdout
@@ -65,8 +64,7 @@ class TestNoChanges:
         # THEN
         assert process.returncode == 0, process.stdout + process.stderr
         for file in files:
-            with open(git_repo.workspace / file, "r") as f:
-                content = f.read()
+            content = (git_repo.workspace / file).read_text()
             assert content == f"<file {file} content sentinel>"
         assert "Detect test tool imports in src files" in process.stdout
         assert "Passed" in process.stdout, process.stdout
@@ -89,8 +87,7 @@ class TestNoChanges:
 
         # THEN
         assert process.returncode == 0, process.stdout + process.stderr
-        with open(git_repo.workspace / file, "r") as f:
-            content = f.read()
+        content = (git_repo.workspace / file).read_text()
         assert content == f"<file {file} content sentinel>"
         assert "Detect test tool imports in src files" in process.stdout
         assert "Passed" in process.stdout, process.stdout
@@ -43,8 +43,7 @@ class TestNoChanges:
         # THEN
         assert process.returncode == 0, process.stdout + process.stderr
         for file in files:
-            with open(git_repo.workspace / file, "r") as f:
-                content = f.read()
+            content = (git_repo.workspace / file).read_text()
             assert content == f"<file {file} content sentinel>"
         assert "Sort gitignore sections" in process.stdout
         assert "Passed" in process.stdout
@@ -65,8 +64,7 @@ class TestNoChanges:
 
         # THEN
         assert process.returncode == 0, process.stdout + process.stderr
-        with open(git_repo.workspace / file, "r") as f:
-            content = f.read()
+        content = (git_repo.workspace / file).read_text()
         assert content == file_contents
         assert "Sort gitignore sections" in process.stdout
         assert "Passed" in process.stdout
@@ -84,8 +82,7 @@ class TestNoChanges:
 
         # THEN
         assert process.returncode == 0, process.stdout + process.stderr
-        with open(git_repo.workspace / file, "r") as f:
-            content = f.read()
+        content = (git_repo.workspace / file).read_text()
         assert content == ""
         assert "Sort gitignore sections" in process.stdout
         assert "Passed" in process.stdout
@@ -114,8 +111,7 @@ class TestSorting:
 
         # THEN
         assert process.returncode == 1, process.stdout + process.stderr
-        with open(git_repo.workspace / filename, "r") as f:
-            content = f.read()
+        content = (git_repo.workspace / filename).read_text()
         assert_matching(
             "output file contents",
             "expected file contents",
@@ -65,8 +65,7 @@ class TestNoChanges:
 
         # THEN
         # Gather actual outputs
-        with open(git_repo.workspace / file, "r") as f:
-            output_content = f.read()
+        output_content = (git_repo.workspace / file).read_text()
         captured = capsys.readouterr()
 
         # Compare
@@ -107,8 +106,7 @@ class TestNoChanges:
 
         # THEN
         # Gather actual outputs
-        with open(git_repo.workspace / file, "r") as f:
-            output_content = f.read()
+        output_content = (git_repo.workspace / file).read_text()
         captured = capsys.readouterr()
 
         # Compare
@@ -142,8 +140,7 @@ class TestNoChanges:
 
         # THEN
         # Gather actual outputs
-        with open(git_repo.workspace / file, "r") as f:
-            output_content = f.read()
+        output_content = (git_repo.workspace / file).read_text()
         captured = capsys.readouterr()
 
         # Compare
@@ -164,6 +161,7 @@ class TestChanges:
             ("Copyright 1066 NAME", "Copyright 1066-1312 NAME"),
             ("Copyright (c) 1066 NAME", "Copyright (c) 1066-1312 NAME"),
             ("(c) 1066 NAME", "(c) 1066-1312 NAME"),
+            ("Copyright 1066 NAME 1066", "Copyright 1066-1312 NAME 1066"),
         ],
     )
     @freeze_time("1312-01-01")
@@ -202,8 +200,7 @@ class TestChanges:
         )
 
         # Gather actual outputs
-        with open(git_repo.workspace / file, "r") as f:
-            output_content = f.read()
+        output_content = (git_repo.workspace / file).read_text()
         captured = capsys.readouterr()
 
         # Compare
@@ -222,6 +219,7 @@ class TestChanges:
         [
             ("Copyright 1066 - 1088 NAME", "Copyright 1066 - 1312 NAME"),
             ("Copyright (c) 1066-1088 NAME", "Copyright (c) 1066-1312 NAME"),
+            ("Copyright 1066-1088 NAME 1088", "Copyright 1066-1312 NAME 1088"),
         ],
     )
     @freeze_time("1312-01-01")
@@ -260,8 +258,7 @@ class TestChanges:
         )
 
         # Gather actual outputs
-        with open(git_repo.workspace / file, "r") as f:
-            output_content = f.read()
+        output_content = (git_repo.workspace / file).read_text()
         captured = capsys.readouterr()
 
         # Compare
@@ -281,6 +278,7 @@ class TestChanges:
             ("Copyright 1066 NAME", "Copyright 1066-1312 NAME"),
             ("Copyright (c) 1066 NAME", "Copyright (c) 1066-1312 NAME"),
             ("(c) 1066 NAME", "(c) 1066-1312 NAME"),
+            ("Copyright 1066 NAME 1066", "Copyright 1066-1312 NAME 1066"),
         ],
     )
     @freeze_time("1312-01-01")
@@ -316,8 +314,7 @@ class TestChanges:
         )
 
         # Gather actual outputs
-        with open(git_repo.workspace / file, "r") as f:
-            output_content = f.read()
+        output_content = (git_repo.workspace / file).read_text()
         captured = capsys.readouterr()
 
         # Compare
@@ -336,6 +333,7 @@ class TestChanges:
         [
             ("Copyright 1066 - 1088 NAME", "Copyright 1066 - 1312 NAME"),
             ("Copyright (c) 1066-1088 NAME", "Copyright (c) 1066-1312 NAME"),
+            ("Copyright 1066-1088 NAME 1088", "Copyright 1066-1312 NAME 1088"),
         ],
     )
     @freeze_time("1312-01-01")
@@ -371,8 +369,7 @@ class TestChanges:
         )
 
         # Gather actual outputs
-        with open(git_repo.workspace / file, "r") as f:
-            output_content = f.read()
+        output_content = (git_repo.workspace / file).read_text()
         captured = capsys.readouterr()
 
         # Compare
@@ -384,6 +381,167 @@ class TestChanges:
         )
         assert_matching("captured stderr", "expected stderr", captured.err, "")
 
+    @staticmethod
+    @pytest.mark.parametrize("language", CopyrightGlobals.SUPPORTED_LANGUAGES)
+    @pytest.mark.parametrize(
+        "input_copyright_string, expected_copyright_string",
+        [
+            ("Copyright 1066 NAME", "Copyright 1066-1312 NAME"),
+            ("Copyright 1066-1088 NAME", "Copyright 1066-1312 NAME"),
+        ],
+    )
+    @freeze_time("1312-01-01")
+    def test_preserves_crlf_line_endings(
+        capsys: CaptureFixture,
+        cwd,
+        expected_copyright_string: str,
+        git_repo: GitRepo,
+        input_copyright_string: str,
+        language: SupportedLanguage,
+        mocker: MockerFixture,
+    ):
+        # GIVEN
+        add_changed_files(
+            file := "hello" + language.extension,
+            language.comment_format.format(content=input_copyright_string)
+            + "\r\n\r\n<file content sentinel>\r\n",
+            git_repo,
+            mocker,
+        )
+
+        # WHEN
+        with cwd(git_repo.workspace):
+            assert update_copyright.main() == 1
+
+        # THEN
+        # Construct expected outputs
+        new_copyright_string = language.comment_format.format(
+            content=expected_copyright_string
+        )
+        expected_content = (
+            f"{new_copyright_string}\r\n\r\n<file content sentinel>\r\n"
+        ).encode()
+        expected_stdout = (
+            f"Fixing file `{file}`:\n"
+            f"\033[91m  - {language.comment_format.format(content=input_copyright_string)}\033[0m\n"  # noqa: E501
+            f"\033[92m  + {new_copyright_string}\033[0m\n"
+        )
+
+        # Gather actual outputs
+        output_content = (git_repo.workspace / file).read_bytes()
+        captured = capsys.readouterr()
+
+        # Compare
+        assert output_content == expected_content
+        assert_matching(
+            "captured stdout", "expected stdout", captured.out, expected_stdout
+        )
+        assert_matching("captured stderr", "expected stderr", captured.err, "")
+
+    @staticmethod
+    @pytest.mark.parametrize("language", CopyrightGlobals.SUPPORTED_LANGUAGES)
+    @pytest.mark.parametrize(
+        "input_copyright_string, expected_copyright_string",
+        [
+            ("Copyright © 1066 NAMÉ", "Copyright © 1066-1312 NAMÉ"),
+            ("Copyright © 1066-1088 NAMÉ", "Copyright © 1066-1312 NAMÉ"),
+        ],
+    )
+    @freeze_time("1312-01-01")
+    def test_updates_year_after_non_ascii_text(
+        capsys: CaptureFixture,
+        cwd,
+        expected_copyright_string: str,
+        git_repo: GitRepo,
+        input_copyright_string: str,
+        language: SupportedLanguage,
+        mocker: MockerFixture,
+    ):
+        # GIVEN
+        add_changed_files(
+            file := "hello" + language.extension,
+            "<préambule sentinel>\n"
+            + language.comment_format.format(content=input_copyright_string)
+            + "\n\n<file content sentinel>",
+            git_repo,
+            mocker,
+        )
+
+        # WHEN
+        with cwd(git_repo.workspace):
+            assert update_copyright.main() == 1
+
+        # THEN
+        # Construct expected outputs
+        new_copyright_string = language.comment_format.format(
+            content=expected_copyright_string
+        )
+        expected_content = (
+            f"<préambule sentinel>\n{new_copyright_string}\n\n<file content sentinel>"
+        )
+        expected_stdout = (
+            f"Fixing file `{file}`:\n"
+            f"\033[91m  - {language.comment_format.format(content=input_copyright_string)}\033[0m\n"  # noqa: E501
+            f"\033[92m  + {new_copyright_string}\033[0m\n"
+        )
+
+        # Gather actual outputs
+        output_content = (git_repo.workspace / file).read_text()
+        captured = capsys.readouterr()
+
+        # Compare
+        assert_matching(
+            "output content", "expected content", output_content, expected_content
+        )
+        assert_matching(
+            "captured stdout", "expected stdout", captured.out, expected_stdout
+        )
+        assert_matching("captured stderr", "expected stderr", captured.err, "")
+
+    @staticmethod
+    @pytest.mark.parametrize("language", CopyrightGlobals.DOCSTR_SUPPORTED_LANGUAGES)
+    @freeze_time("1312-01-01")
+    def test_reports_docstring_that_cannot_be_located(
+        capsys: CaptureFixture,
+        cwd,
+        git_repo: GitRepo,
+        language: SupportedLanguage,
+        mocker: MockerFixture,
+    ):
+        # GIVEN
+        # The escape sequence means the docstring's text doesn't appear in the source.
+        add_changed_files(
+            file := "hello" + language.extension,
+            file_content := '"""\nCopyright 1066 N\\x41ME\n"""\n',
+            git_repo,
+            mocker,
+        )
+
+        # WHEN
+        with cwd(git_repo.workspace):
+            assert update_copyright.main() == 1
+
+        # THEN
+        # Construct expected outputs
+        expected_stdout = (
+            f"Could not update file `{file}`, please update its copyright string "
+            "manually:\n"
+            "\033[91m  - Copyright 1066 NAME\033[0m\n"
+        )
+
+        # Gather actual outputs
+        output_content = (git_repo.workspace / file).read_text()
+        captured = capsys.readouterr()
+
+        # Compare
+        assert_matching(
+            "output content", "expected content", output_content, file_content
+        )
+        assert_matching(
+            "captured stdout", "expected stdout", captured.out, expected_stdout
+        )
+        assert_matching("captured stderr", "expected stderr", captured.err, "")
+
 
 class TestFailureStates:
     @staticmethod
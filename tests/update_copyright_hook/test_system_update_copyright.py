@@ -52,8 +52,7 @@ class TestNoChanges:
         # THEN
         assert process.returncode == 0, process.stdout + process.stderr
         for file in files:
-            with open(git_repo.workspace / file, "r") as f:
-                content = f.read()
+            content = (git_repo.workspace / file).read_text()
             assert content == f"<file {file} content sentinel>"
         assert (
             "Update dates on copyright strings in source files" in process.stdout
@@ -93,8 +92,7 @@ class TestNoChanges:
 
         # THEN
         assert process.returncode == 0, process.stdout + process.stderr
-        with open(git_repo.workspace / file, "r") as f:
-            output_content = f.read()
+        output_content = (git_repo.workspace / file).read_text()
         assert_matching(
             "output content", "expected content", output_content, file_content
         )
@@ -123,8 +121,7 @@ class TestNoChanges:
 
         # THEN
         assert process.returncode == 0, process.stdout + process.stderr
-        with open(git_repo.workspace / file, "r") as f:
-            output_content = f.read()
+        output_content = (git_repo.workspace / file).read_text()
         assert_matching(
             "output content", "expected content", output_content, file_content
         )
@@ -178,8 +175,7 @@ class TestChanges:
                 f"\033[91m  - {language.comment_format.format(content = input_copyright_string)}\033[0m\n"  # noqa: E501
                 f"\033[92m  + {copyright_string}\033[0m\n"
             )
-            with open(git_repo.workspace / file, "r") as f:
-                output_content = f.read()
+            output_content = (git_repo.workspace / file).read_text()
 
             assert_matching(
                 "output content",
@@ -233,8 +229,7 @@ class TestChanges:
                 f"\033[91m  - {language.comment_format.format(content = input_copyright_string)}\033[0m\n"  # noqa: E501
                 f"\033[92m  + {copyright_string}\033[0m\n"
             )
-            with open(git_repo.workspace / file, "r") as f:
-                output_content = f.read()
+            output_content = (git_repo.workspace / file).read_text()
 
             assert_matching(
                 "output content",